@@ -0,0 +1,80 @@
+# HRM/middleware.py
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.core.handlers.exception import convert_exception_to_response
+from django.utils.module_loading import import_string
+
+
+class PathScopedMiddleware:
+    """
+    Runs FULL_STACK_MIDDLEWARE (sessions, CSRF, auth, messages, ...) only for
+    requests that need it. Paths under LEAN_MIDDLEWARE_PREFIXES (the stateless
+    JWT API) skip straight to the view, unless they also match one of
+    LEAN_MIDDLEWARE_EXEMPT_PREFIXES (e.g. the browsable API docs).
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.lean_prefixes = tuple(getattr(settings, "LEAN_MIDDLEWARE_PREFIXES", ()))
+        self.exempt_prefixes = tuple(
+            getattr(settings, "LEAN_MIDDLEWARE_EXEMPT_PREFIXES", ()))
+
+        self._view_middleware = []
+        self._template_response_middleware = []
+        self._exception_middleware = []
+
+        # Same wiring as django.core.handlers.base.BaseHandler.load_middleware,
+        # synchronous only.
+        handler = get_response
+        for middleware_path in reversed(settings.FULL_STACK_MIDDLEWARE):
+            middleware = import_string(middleware_path)
+            try:
+                mw_instance = middleware(handler)
+            except MiddlewareNotUsed:
+                continue
+
+            if hasattr(mw_instance, "process_view"):
+                self._view_middleware.insert(0, mw_instance.process_view)
+            if hasattr(mw_instance, "process_template_response"):
+                self._template_response_middleware.append(
+                    mw_instance.process_template_response)
+            if hasattr(mw_instance, "process_exception"):
+                self._exception_middleware.append(mw_instance.process_exception)
+
+            handler = convert_exception_to_response(mw_instance)
+
+        self.full_stack = handler
+
+    def is_lean(self, request):
+        path = request.path_info
+        return path.startswith(self.lean_prefixes) and not path.startswith(self.exempt_prefixes)
+
+    def __call__(self, request):
+        if self.is_lean(request):
+            return self.get_response(request)
+        return self.full_stack(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if self.is_lean(request):
+            return None
+        for method in self._view_middleware:
+            response = method(request, view_func, view_args, view_kwargs)
+            if response:
+                return response
+        return None
+
+    def process_template_response(self, request, response):
+        if self.is_lean(request):
+            return response
+        for method in self._template_response_middleware:
+            response = method(request, response)
+        return response
+
+    def process_exception(self, request, exception):
+        if self.is_lean(request):
+            return None
+        for method in self._exception_middleware:
+            response = method(request, exception)
+            if response:
+                return response
+        return None
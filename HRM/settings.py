@@ -40,14 +40,27 @@ MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'corsheaders.middleware.CorsMiddleware',
-    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
+    'HRM.middleware.PathScopedMiddleware',
+    'django.middleware.clickjacking.XFrameOptionsMiddleware',
+]
+
+# Stateful middleware, only run for admin/docs. The Bearer-token API under
+# LEAN_MIDDLEWARE_PREFIXES never touches sessions, CSRF or messages.
+FULL_STACK_MIDDLEWARE = [
+    'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
-    'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+LEAN_MIDDLEWARE_PREFIXES = ['/api/']
+LEAN_MIDDLEWARE_EXEMPT_PREFIXES = ['/api/schema/']
+
+# The admin checks only look at MIDDLEWARE; sessions/auth/messages are still
+# installed for /admin/ through FULL_STACK_MIDDLEWARE above.
+SILENCED_SYSTEM_CHECKS = ['admin.E408', 'admin.E409', 'admin.E410']
+
 
 ROOT_URLCONF = 'HRM.urls'
 
@@ -61,6 +74,16 @@ REST_FRAMEWORK = {
     "DEFAULT_PERMISSION_CLASSES": (
         "rest_framework.permissions.IsAuthenticated",
     ),
+    # orjson-backed, falls back to stdlib json when orjson isn't installed
+    "DEFAULT_RENDERER_CLASSES": (
+        "login.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "login.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 25,
 
@@ -97,6 +120,32 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
 }
 
+# In-memory filter of registered emails used to reject forgot-password
+# requests for unknown addresses without a DB query (login/email_filter.py).
+# Staleness window for a newly added email in other workers:
+#   - saved through the ORM (post_save, any process): VERSION_CHECK_SECONDS,
+#     via the shared EmailFilterVersion row;
+#   - QuerySet.update()/bulk_create/raw SQL: RESYNC_SECONDS, unless the caller
+#     runs known_emails.invalidate() afterwards.
+# During that window forgot-password answers "Email not found." for the user.
+EMAIL_FILTER = {
+    "CAPACITY": 100_000,
+    "ERROR_RATE": 0.01,
+    "VERSION_CHECK_SECONDS": 1,
+    "RESYNC_SECONDS": 60,
+}
+
+# Per-worker concurrency caps for endpoints that hash passwords
+# (login/admission.py). LIMIT in flight, QUEUE more may wait up to TIMEOUT
+# seconds, everything beyond gets 503 with Retry-After: RETRY_AFTER.
+# Sized for the Procfile's gthread worker with 8 threads: login and
+# reset-password together hold at most 6 (LIMIT + QUEUE each), so 2 threads
+# always stay free for /api/refresh/ and the rest of the API.
+ADMISSION_CONTROL = {
+    "login": {"LIMIT": 2, "QUEUE": 2, "TIMEOUT": 1.0, "RETRY_AFTER": 1},
+    "reset-password": {"LIMIT": 1, "QUEUE": 1, "TIMEOUT": 1.0, "RETRY_AFTER": 1},
+}
+
 
 TEMPLATES = [
     {
@@ -183,11 +232,22 @@ LOGGING = {
             'format': '[%(levelname)s] %(asctime)s %(name)s: %(message)s'
         }
     },
+    'filters': {
+        'admission_shed': {
+            '()': 'login.admission.ShedLogFilter', 'interval': 10
+        }
+    },
     'handlers': {
         'console': {
             'class': 'logging.StreamHandler', 'formatter': 'default'
         }
     },
+    'loggers': {
+        # 503s from admission control are sampled and logged as warnings
+        'django.request': {
+            'filters': ['admission_shed']
+        }
+    },
     'root': {
         'handlers': ['console'], 'level': 'INFO'
     },
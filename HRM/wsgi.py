@@ -18,6 +18,16 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'HRM.settings')
 # Get the Django WSGI application
 django_app = get_wsgi_application()
 
+# Warm the known-email filter per worker; falls back to building on first use
+# if the database isn't reachable/migrated yet.
+from django.db import DatabaseError  # noqa: E402
+from login.email_filter import known_emails  # noqa: E402
+
+try:
+    known_emails.rebuild()
+except DatabaseError:
+    pass
+
 # Wrap with WhiteNoise for static files
 application = WhiteNoise(
     django_app,
@@ -0,0 +1,136 @@
+# login/admission.py
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+
+class Overloaded(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "Server is busy, please retry shortly."
+    default_code = "overloaded"
+
+    def __init__(self, wait=None, detail=None, code=None):
+        # DRF's exception handler turns `wait` into a Retry-After header.
+        self.wait = math.ceil(wait) if wait is not None else None
+        super().__init__(detail, code)
+
+
+class ConcurrencyLimiter:
+    """
+    Caps in-flight requests for one endpoint in this worker. Up to `queue_size`
+    extra requests wait at most `timeout` seconds for a slot; the rest are shed.
+    """
+
+    def __init__(self, limit, queue_size=0, timeout=0.0):
+        self.limit = limit
+        self.queue_size = queue_size
+        self.timeout = timeout
+        self.active = 0
+        self.waiting = 0
+        self._cond = threading.Condition()
+
+    def acquire(self):
+        with self._cond:
+            if self.active < self.limit:
+                self.active += 1
+                return True
+            if self.waiting >= self.queue_size:
+                return False
+
+            self.waiting += 1
+            deadline = time.monotonic() + self.timeout
+            try:
+                while self.active >= self.limit:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._cond.wait(remaining)
+            finally:
+                self.waiting -= 1
+            self.active += 1
+            return True
+
+    def release(self):
+        with self._cond:
+            self.active -= 1
+            self._cond.notify()
+
+
+_limiters = {}
+_limiters_lock = threading.Lock()
+
+
+def get_limiter(scope):
+    with _limiters_lock:
+        if scope not in _limiters:
+            config = settings.ADMISSION_CONTROL[scope]
+            _limiters[scope] = ConcurrencyLimiter(
+                limit=config["LIMIT"],
+                queue_size=config.get("QUEUE", 0),
+                timeout=config.get("TIMEOUT", 0.0),
+            )
+        return _limiters[scope]
+
+
+def reset_limiters():
+    with _limiters_lock:
+        _limiters.clear()
+
+
+class ShedLogFilter(logging.Filter):
+    """
+    Filter for the django.request logger. Shed requests would each be logged
+    as a 5xx ERROR; instead log them at WARNING, at most once per `interval`
+    seconds, with a count of the ones suppressed in between.
+    """
+
+    def __init__(self, interval=10):
+        super().__init__()
+        self.interval = interval
+        self._last = None
+        self._suppressed = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record):
+        if not getattr(getattr(record, "request", None), "admission_shed", False):
+            return True
+
+        now = time.monotonic()
+        with self._lock:
+            if self._last is not None and now - self._last < self.interval:
+                self._suppressed += 1
+                return False
+            suppressed, self._suppressed = self._suppressed, 0
+            self._last = now
+
+        record.levelno = logging.WARNING
+        record.levelname = logging.getLevelName(logging.WARNING)
+        if suppressed:
+            record.msg = f"{record.msg} ({suppressed} more shed since last report)"
+        return True
+
+
+class AdmissionControlMixin:
+    """
+    Bounds concurrent POSTs to a CPU-heavy view (password hashing) so a flood on
+    it can't starve cheap endpoints such as token refresh.
+    Set `admission_scope` to a key of settings.ADMISSION_CONTROL.
+    """
+    admission_scope = None
+
+    def post(self, request, *args, **kwargs):
+        limiter = get_limiter(self.admission_scope)
+        if not limiter.acquire():
+            # Picked up by ShedLogFilter when django.request logs the 503.
+            request._request.admission_shed = True
+            retry_after = settings.ADMISSION_CONTROL[self.admission_scope].get("RETRY_AFTER", 1)
+            raise Overloaded(wait=retry_after)
+        try:
+            return super().post(request, *args, **kwargs)
+        finally:
+            limiter.release()
@@ -0,0 +1,167 @@
+# login/email_filter.py
+import hashlib
+import logging
+import math
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import EmailFilterVersion
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_email(email):
+    return (email or "").strip().lower()
+
+
+def current_version():
+    return EmailFilterVersion.objects.filter(pk=1).values_list("version", flat=True).first() or 0
+
+
+def bump_version():
+    if not EmailFilterVersion.objects.filter(pk=1).update(version=F("version") + 1):
+        _, created = EmailFilterVersion.objects.get_or_create(pk=1, defaults={"version": 1})
+        if not created:
+            EmailFilterVersion.objects.filter(pk=1).update(version=F("version") + 1)
+    return current_version()
+
+
+class BloomFilter:
+    """Fixed-size bloom filter; memory is set by capacity and error_rate only."""
+
+    def __init__(self, capacity, error_rate):
+        self.capacity = capacity
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for pos in self._positions(value):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(value))
+
+
+class KnownEmailFilter:
+    """
+    Per-worker membership filter of registered emails.
+
+    A miss means "definitely not a user" and lets forgot-password skip the DB.
+    User post_save and post_delete signals, from any process, bump the shared
+    EmailFilterVersion row; each worker reads that row at most once per
+    VERSION_CHECK_SECONDS and rebuilds when it moved. Writes that skip signals
+    (QuerySet.update(), bulk_create, raw SQL) must call invalidate(), otherwise
+    they are only picked up by the RESYNC_SECONDS rebuild.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # Held by the single thread checking the version / rebuilding.
+        self._refresh_lock = threading.Lock()
+        self._filter = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+        self._version = None
+
+    @property
+    def config(self):
+        return getattr(settings, "EMAIL_FILTER", {})
+
+    def rebuild(self):
+        from django.contrib.auth import get_user_model
+
+        config = self.config
+        bloom = BloomFilter(config.get("CAPACITY", 100_000), config.get("ERROR_RATE", 0.01))
+        version = current_version()
+        emails = get_user_model().objects.exclude(email="").values_list("email", flat=True)
+        for email in emails.iterator():
+            bloom.add(normalize_email(email))
+
+        if bloom.count > bloom.capacity:
+            logger.warning(
+                "Email filter holds %s emails, above its capacity of %s; "
+                "false-positive rate will exceed the configured bound.",
+                bloom.count, bloom.capacity)
+
+        with self._lock:
+            self._filter = bloom
+            self._built_at = self._checked_at = time.monotonic()
+            self._version = version
+        return bloom
+
+    def _is_stale(self):
+        if self._filter is None:
+            return True
+        now = time.monotonic()
+        if now - self._built_at > self.config.get("RESYNC_SECONDS", 60):
+            return True
+        if now - self._checked_at < self.config.get("VERSION_CHECK_SECONDS", 1):
+            return False
+        self._checked_at = now
+        return current_version() != self._version
+
+    def might_contain(self, email):
+        bloom = self._filter
+        if bloom is None:
+            # Nothing to fall back on yet: wait for the first build.
+            with self._refresh_lock:
+                if self._filter is None:
+                    self.rebuild()
+            bloom = self._filter
+        elif self._refresh_lock.acquire(blocking=False):
+            # One thread checks/rebuilds; the rest keep answering from the
+            # current filter instead of all scanning the User table at once.
+            try:
+                if self._is_stale():
+                    bloom = self.rebuild()
+            finally:
+                self._refresh_lock.release()
+        return normalize_email(email) in bloom
+
+    def add(self, email):
+        """
+        Record a new or changed user email. The local filter is only a cache:
+        the shared version is always bumped (after commit), since an email that
+        already tests positive here may be missing from other workers' filters.
+        """
+        email = normalize_email(email)
+        if not email:
+            return
+        with self._lock:
+            if self._filter is not None:
+                self._filter.add(email)
+        transaction.on_commit(self._bump_after_add)
+
+    def _bump_after_add(self):
+        with self._lock:
+            previous = self._version
+        version = bump_version()
+        with self._lock:
+            # Our filter already holds the email; skip our own rebuild only if
+            # nobody else bumped or rebuilt in between.
+            if previous is not None and self._version == previous and version == previous + 1:
+                self._version = version
+
+    def invalidate(self):
+        """Make every worker rebuild on its next version check."""
+        bump_version()
+
+    def reset(self):
+        with self._lock:
+            self._filter = None
+
+
+known_emails = KnownEmailFilter()
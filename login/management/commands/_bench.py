@@ -0,0 +1,62 @@
+# Shared helpers for the bench_* management commands.
+import statistics
+import time
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import (
+    setup_test_environment,
+    teardown_test_environment,
+)
+
+
+@contextmanager
+def bench_database():
+    """Run against a throwaway test database so db.sqlite3 is never touched."""
+    setup_test_environment()
+    old_name = connection.settings_dict["NAME"]
+    connection.creation.create_test_db(verbosity=0, autoclobber=True)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def timed(fn, iterations):
+    """Call fn() `iterations` times and return per-call timings in microseconds."""
+    samples = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def timed_interleaved(fn_a, fn_b, iterations):
+    """
+    Time fn_a and fn_b alternately, swapping which goes first each round, so
+    drift (GC, CPU frequency, cache warmth) hits both sides equally.
+    """
+    samples_a, samples_b = [], []
+    for i in range(iterations):
+        pairs = ((fn_a, samples_a), (fn_b, samples_b))
+        for fn, samples in (pairs if i % 2 == 0 else reversed(pairs)):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples_a, samples_b
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summary(samples):
+    return {
+        "mean": statistics.fmean(samples),
+        "p50": percentile(samples, 50),
+        "p99": percentile(samples, 99),
+    }
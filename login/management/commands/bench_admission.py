@@ -0,0 +1,145 @@
+import threading
+import time
+from collections import Counter
+from concurrent.futures import CancelledError, ThreadPoolExecutor
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+from django.urls import reverse
+
+from login.admission import reset_limiters
+
+from ._bench import bench_database, summary
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Load test: /api/refresh/ latency while /api/login/ is flooded, with and without admission control'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--flood', type=int, default=16, help='Concurrent login threads')
+        parser.add_argument('--duration', type=float, default=5.0, help='Seconds per run')
+        parser.add_argument('--threads', type=int, default=8,
+                            help='Request threads in the simulated worker (Procfile: --threads 8)')
+        parser.add_argument('--probe-interval', type=float, default=0.02,
+                            help='Seconds between refresh requests, sent on a fixed schedule')
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+
+        limited = settings.ADMISSION_CONTROL
+        unlimited = {scope: {**config, 'LIMIT': 10 ** 6} for scope, config in limited.items()}
+
+        # The dummy cache keeps the anon throttle out of the picture; the real
+        # (slow) password hasher is what this test is about.
+        with bench_database(), override_settings(
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+            User.objects.create_user(
+                username='bench', password='BenchPass1!', role='employee')
+            refresh = Client().post(
+                reverse('token_obtain_pair'),
+                {'username': 'bench', 'password': 'BenchPass1!'},
+                content_type='application/json',
+            ).json()['refresh']
+
+            for label, config in (('no limit', unlimited), ('admission control', limited)):
+                with override_settings(ADMISSION_CONTROL=config):
+                    reset_limiters()
+                    latencies, pending, logins = self.run_flood(
+                        refresh, options['flood'], options['duration'], options['threads'],
+                        options['probe_interval'])
+                reset_limiters()
+
+                # Refreshes still queued at the cutoff count at their age so
+                # far, so the percentiles are lower bounds when pending > 0.
+                stats = summary(latencies + pending)
+                bound = '>=' if pending else '  '
+                self.stdout.write(
+                    f'{label:>18}: refresh sent {len(latencies) + len(pending):5d} '
+                    f'done {len(latencies):5d} pending {len(pending):5d} | '
+                    f'p50 {bound}{stats["p50"] / 1000:8.1f}ms  p99 {bound}{stats["p99"] / 1000:8.1f}ms | '
+                    f'login statuses {dict(sorted(logins.items()))}'
+                )
+                if pending:
+                    self.stdout.write(self.style.WARNING(
+                        f'{label:>18}: {len(pending)} refreshes still queued at the cutoff; '
+                        f'latency is unbounded and grows with --duration'))
+                elif len(latencies) < 100:
+                    self.stdout.write(self.style.WARNING(
+                        f'{label:>18}: only {len(latencies)} refreshes completed; '
+                        f'p99 is not meaningful, raise --duration'))
+
+    def run_flood(self, refresh, flood, duration, threads, probe_interval):
+        """
+        Models one worker with a fixed pool of request threads (gunicorn
+        gthread): `flood` clients keep login requests outstanding while a
+        probe submits a refresh every `probe_interval` seconds, whether or not
+        earlier ones finished, and records latency including time queued for
+        a free worker thread.
+        """
+        stop = threading.Event()
+        logins = Counter()
+        lock = threading.Lock()
+        pool = ThreadPoolExecutor(max_workers=threads)
+        local = threading.local()
+        login_url = reverse('token_obtain_pair')
+        refresh_url = reverse('token_refresh')
+        probes = []
+
+        def client():
+            if not hasattr(local, 'client'):
+                local.client = Client()
+            return local.client
+
+        def login():
+            return client().post(
+                login_url, {'username': 'bench', 'password': 'BenchPass1!'},
+                content_type='application/json').status_code
+
+        def do_refresh(submitted):
+            response = client().post(
+                refresh_url, {'refresh': refresh}, content_type='application/json')
+            assert response.status_code == 200, response.status_code
+            return time.perf_counter() - submitted
+
+        def flood_client():
+            while not stop.is_set():
+                try:
+                    status_code = pool.submit(login).result()
+                except CancelledError:
+                    return
+                with lock:
+                    logins[status_code] += 1
+                if status_code == 503:
+                    time.sleep(0.01)
+
+        def probe_client():
+            next_at = time.perf_counter()
+            while not stop.is_set():
+                submitted = time.perf_counter()
+                probes.append((submitted, pool.submit(do_refresh, submitted)))
+                next_at += probe_interval
+                time.sleep(max(0.0, next_at - time.perf_counter()))
+
+        clients = [threading.Thread(target=flood_client) for _ in range(flood)]
+        clients.append(threading.Thread(target=probe_client))
+        for thread in clients:
+            thread.start()
+        time.sleep(duration)
+        stop.set()
+        clients[-1].join()
+
+        cutoff = time.perf_counter()
+        latencies, pending = [], []
+        for submitted, future in probes:
+            if future.done():
+                latencies.append(future.result() * 1e6)
+            else:
+                pending.append((cutoff - submitted) * 1e6)
+
+        pool.shutdown(cancel_futures=True)
+        for thread in clients[:-1]:
+            thread.join()
+        return latencies, pending, logins
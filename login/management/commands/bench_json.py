@@ -0,0 +1,55 @@
+import io
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from login.parsers import FastJSONParser
+from login.renderers import FastJSONRenderer, orjson
+from login.serializers import CustomTokenSerializer, ResetPasswordSerializer
+
+from ._bench import bench_database, summary, timed
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = 'Compare DRF JSONRenderer/JSONParser with the orjson-backed FastJSONRenderer/FastJSONParser'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=20000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        if orjson is None:
+            self.stdout.write(self.style.WARNING('orjson not installed: FastJSON* is using stdlib json'))
+
+        with bench_database(), override_settings(
+                PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher']):
+            User.objects.create_user(
+                username='bench', password='BenchPass1!', role='management')
+            login = CustomTokenSerializer(data={'username': 'bench', 'password': 'BenchPass1!'})
+            login.is_valid(raise_exception=True)
+            payloads = {'login response': login.validated_data}
+
+        reset = ResetPasswordSerializer(data={
+            'email': 'not-an-email',
+            'new_password': 'short',
+            'confirm_password': 'short',
+        })
+        reset.is_valid()
+        payloads['error response'] = reset.errors
+
+        for name, data in payloads.items():
+            body = JSONRenderer().render(data)
+            for label, renderer, parser in (
+                    ('stdlib', JSONRenderer(), JSONParser()),
+                    ('fast', FastJSONRenderer(), FastJSONParser())):
+                render = summary(timed(lambda: renderer.render(data), iterations))
+                parse = summary(timed(lambda: parser.parse(io.BytesIO(body)), iterations))
+                self.stdout.write(
+                    f'{name:>14} {label:>6}: render mean {render["mean"]:6.2f}us p99 {render["p99"]:6.2f}us | '
+                    f'parse mean {parse["mean"]:6.2f}us p99 {parse["p99"]:6.2f}us | {len(body)} bytes'
+                )
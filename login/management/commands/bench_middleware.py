@@ -0,0 +1,121 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.handlers.base import BaseHandler
+from django.core.management.base import BaseCommand
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, override_settings
+from django.urls import path, reverse
+from django.views.decorators.csrf import csrf_exempt
+
+from ._bench import bench_database, summary, timed_interleaved
+
+User = get_user_model()
+
+
+@csrf_exempt
+def stub_view(request):
+    # csrf_exempt like every DRF APIView, so CsrfViewMiddleware behaves as it
+    # does for the real endpoints.
+    return HttpResponse(b'{}', content_type='application/json')
+
+
+# ROOT_URLCONF for the stub-view run: same paths, no view cost.
+urlpatterns = [
+    path('api/login/', stub_view),
+    path('api/refresh/', stub_view),
+]
+
+
+def full_middleware():
+    """The pre-split stack: MIDDLEWARE with FULL_STACK_MIDDLEWARE inlined."""
+    scoped = 'HRM.middleware.PathScopedMiddleware'
+    index = settings.MIDDLEWARE.index(scoped)
+    return (settings.MIDDLEWARE[:index] + settings.FULL_STACK_MIDDLEWARE
+            + settings.MIDDLEWARE[index + 1:])
+
+
+class Command(BaseCommand):
+    help = 'Measure middleware overhead removed on /api/login/ and /api/refresh/ by the lean API pipeline'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=2000)
+
+    def handle(self, *args, **options):
+        iterations = options['iterations']
+        pipelines = {'full': full_middleware(), 'lean': settings.MIDDLEWARE}
+
+        # bench_database() also sets up the test environment ('testserver'
+        # becomes an allowed host for RequestFactory requests).
+        with bench_database():
+            self.bench_chain(pipelines, iterations)
+            self.bench_views(pipelines, iterations)
+
+    def bench_chain(self, pipelines, iterations):
+        self.stdout.write('middleware chain only (stub view):')
+        with override_settings(ROOT_URLCONF=__name__):
+            handlers = {}
+            for label, middleware in pipelines.items():
+                with override_settings(MIDDLEWARE=middleware):
+                    handlers[label] = BaseHandler()
+                    handlers[label].load_middleware()
+
+            factory = RequestFactory()
+            for endpoint in ('login', 'refresh'):
+                url = f'/api/{endpoint}/'
+
+                def call(handler):
+                    def run():
+                        response = handler.get_response(
+                            factory.post(url, b'{}', content_type='application/json'))
+                        assert response.status_code == 200, response.status_code
+                    return run
+
+                self.report(url, *timed_interleaved(
+                    call(handlers['full']), call(handlers['lean']), iterations))
+
+    def bench_views(self, pipelines, iterations):
+        # End to end through the real views. A cheap hasher and the dummy
+        # cache keep password hashing and the anon throttle out of the way.
+        self.stdout.write('end to end (real views):')
+        with override_settings(
+                PASSWORD_HASHERS=['django.contrib.auth.hashers.MD5PasswordHasher'],
+                CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}}):
+            User.objects.create_user(
+                username='bench', password='BenchPass1!', role='employee')
+            credentials = {'username': 'bench', 'password': 'BenchPass1!'}
+            login_url = reverse('token_obtain_pair')
+            refresh_url = reverse('token_refresh')
+
+            clients = {}
+            for label, middleware in pipelines.items():
+                # The client handler loads its middleware on the first request.
+                with override_settings(MIDDLEWARE=middleware):
+                    clients[label] = Client()
+                    refresh = clients[label].post(
+                        login_url, credentials, content_type='application/json').json()['refresh']
+
+            def login(client):
+                def run():
+                    response = client.post(login_url, credentials, content_type='application/json')
+                    assert response.status_code == 200, response.content
+                return run
+
+            def do_refresh(client):
+                def run():
+                    response = client.post(refresh_url, {'refresh': refresh}, content_type='application/json')
+                    assert response.status_code == 200, response.content
+                return run
+
+            self.report(login_url, *timed_interleaved(
+                login(clients['full']), login(clients['lean']), iterations))
+            self.report(refresh_url, *timed_interleaved(
+                do_refresh(clients['full']), do_refresh(clients['lean']), iterations))
+
+    def report(self, url, full_samples, lean_samples):
+        full = summary(full_samples)
+        lean = summary(lean_samples)
+        self.stdout.write(
+            f'  {url:<14} full p50 {full["p50"]:8.1f}us  p99 {full["p99"]:8.1f}us | '
+            f'lean p50 {lean["p50"]:8.1f}us  p99 {lean["p99"]:8.1f}us | '
+            f'saved {full["p50"] - lean["p50"]:7.1f}us/request (p50)'
+        )
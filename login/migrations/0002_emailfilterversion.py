@@ -0,0 +1,20 @@
+# Generated by Django 5.2.7 on 2026-10-19 16:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('login', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailFilterVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveBigIntegerField(default=0)),
+            ],
+        ),
+    ]
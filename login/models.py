@@ -31,3 +31,14 @@ class PasswordResetOTP(models.Model):
 
     def __str__(self):
         return f"{self.user.username} - OTP {self.otp}"
+
+
+class EmailFilterVersion(models.Model):
+    """
+    Single-row counter shared by all workers. Bumped whenever the set of user
+    emails may have changed, so every worker's KnownEmailFilter rebuilds.
+    """
+    version = models.PositiveBigIntegerField(default=0)
+
+    def __str__(self):
+        return f"Email filter version {self.version}"
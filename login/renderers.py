@@ -0,0 +1,57 @@
+# login/renderers.py
+import math
+
+from rest_framework import renderers
+from rest_framework.utils import encoders
+
+try:
+    import orjson
+except ImportError:  # stdlib json via DRF's JSONRenderer
+    orjson = None
+
+
+def _has_non_finite(data):
+    if isinstance(data, float):
+        return not math.isfinite(data)
+    if isinstance(data, dict):
+        return any(_has_non_finite(value) for value in data.values())
+    if isinstance(data, (list, tuple)):
+        return any(_has_non_finite(value) for value in data)
+    return False
+
+
+class FastJSONRenderer(renderers.JSONRenderer):
+    """
+    JSONRenderer backed by orjson when it is installed. For the dict/list data
+    DRF views return, output matches DRF's renderer: values orjson doesn't
+    handle itself (lazy strings, Decimal,
+    datetimes in DRF's format, ...) go through DRF's JSONEncoder.default.
+    Indented output (browsable API), anything orjson rejects, and NaN/Infinity
+    (which orjson writes as null) fall back to the stdlib path.
+    """
+    _encoder = encoders.JSONEncoder()
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None or data is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data,
+                default=self._encoder.default,
+                option=orjson.OPT_PASSTHROUGH_DATETIME,
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # orjson turns NaN/Infinity into null where DRF raises (STRICT_JSON)
+        # or writes NaN; only walk the data when a null could be one of them.
+        if b'null' in ret and _has_non_finite(data):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same \u2028/\u2029 escaping as DRF, see JSONRenderer.render.
+        if b'\xe2\x80\xa8' in ret or b'\xe2\x80\xa9' in ret:
+            ret = ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
+        return ret
@@ -3,6 +3,7 @@ from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from .models import PasswordResetOTP
+from .email_filter import known_emails
 from .utils import generate_otp, send_otp_email
 
 User = get_user_model()
@@ -43,7 +44,11 @@ class ForgotPasswordSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         email = validated_data["email"]
-        user = User.objects.filter(email=email).first()
+
+        # Unknown addresses are rejected without touching the DB.
+        user = None
+        if known_emails.might_contain(email):
+            user = User.objects.filter(email=email).first()
 
         if not user:
             raise serializers.ValidationError({"email": "Email not found."})
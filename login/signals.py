@@ -1,3 +1,20 @@
 # login/signals.py
-# EMPTY FILE – DO NOT HANDLE EMPLOYEE CREATION HERE
+# DO NOT HANDLE EMPLOYEE CREATION HERE
 # EmployeeProfile creation is handled in emp/signals.py ONLY.
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.conf import settings
+
+from .email_filter import known_emails
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def track_user_email(sender, instance, created, update_fields=None, **kwargs):
+    if created or update_fields is None or "email" in update_fields:
+        known_emails.add(instance.email)
+
+
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def forget_user_email(sender, instance, **kwargs):
+    # A bloom filter can't remove entries; have every worker rebuild without it.
+    known_emails.invalidate()
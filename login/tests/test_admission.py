@@ -0,0 +1,105 @@
+import logging
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from login.admission import (
+    ConcurrencyLimiter,
+    ShedLogFilter,
+    get_limiter,
+    reset_limiters,
+)
+
+User = get_user_model()
+
+
+class ConcurrencyLimiterTests(APITestCase):
+    def test_sheds_beyond_limit_and_queue(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=0)
+        self.assertTrue(limiter.acquire())
+        self.assertFalse(limiter.acquire())
+        limiter.release()
+        self.assertTrue(limiter.acquire())
+
+    def test_queued_request_gets_released_slot(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=5)
+        limiter.acquire()
+        result = []
+        waiter = threading.Thread(target=lambda: result.append(limiter.acquire()))
+        waiter.start()
+        limiter.release()
+        waiter.join()
+        self.assertEqual(result, [True])
+
+    def test_queue_wait_times_out(self):
+        limiter = ConcurrencyLimiter(limit=1, queue_size=1, timeout=0.01)
+        limiter.acquire()
+        self.assertFalse(limiter.acquire())
+        self.assertEqual(limiter.waiting, 0)
+
+
+@override_settings(ADMISSION_CONTROL={
+    "login": {"LIMIT": 1, "QUEUE": 0, "RETRY_AFTER": 2},
+    "reset-password": {"LIMIT": 1, "QUEUE": 0, "RETRY_AFTER": 2},
+})
+class AdmissionControlViewTests(APITestCase):
+    def setUp(self):
+        reset_limiters()
+        self.addCleanup(reset_limiters)
+        User.objects.create_user(
+            username="busy", password="BusyPass1!", role="employee")
+
+    def test_login_shed_with_retry_after_refresh_unaffected(self):
+        r = self.client.post(reverse("token_obtain_pair"), {
+            "username": "busy", "password": "BusyPass1!"
+        }, format="json")
+        self.assertEqual(r.status_code, 200)
+
+        get_limiter("login").acquire()
+        r2 = self.client.post(reverse("token_obtain_pair"), {
+            "username": "busy", "password": "BusyPass1!"
+        }, format="json")
+        self.assertEqual(r2.status_code, 503)
+        self.assertEqual(r2["Retry-After"], "2")
+
+        r3 = self.client.post(reverse("token_refresh"), {
+            "refresh": r.data["refresh"]
+        }, format="json")
+        self.assertEqual(r3.status_code, 200)
+
+    def test_reset_password_shed(self):
+        get_limiter("reset-password").acquire()
+        r = self.client.post(reverse("reset-password"), {
+            "email": "busy@example.com",
+            "new_password": "NewPass123!",
+            "confirm_password": "NewPass123!"
+        }, format="json")
+        self.assertEqual(r.status_code, 503)
+
+
+class ShedLogFilterTests(APITestCase):
+    def setUp(self):
+        reset_limiters()
+        self.addCleanup(reset_limiters)
+        # The filter configured in LOGGING, with no report in the last interval.
+        shed_filter = next(f for f in logging.getLogger("django.request").filters
+                           if isinstance(f, ShedLogFilter))
+        patcher = mock.patch.object(shed_filter, "_last", None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(ADMISSION_CONTROL={"login": {"LIMIT": 1, "QUEUE": 0}})
+    def test_shed_requests_sampled_at_warning(self):
+        get_limiter("login").acquire()
+        with self.assertLogs("django.request", level="WARNING") as logs:
+            for _ in range(5):
+                r = self.client.post(reverse("token_obtain_pair"), {
+                    "username": "busy", "password": "BusyPass1!"
+                }, format="json")
+                self.assertEqual(r.status_code, 503)
+
+        self.assertEqual([record.levelname for record in logs.records], ["WARNING"])
@@ -0,0 +1,169 @@
+import threading
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from login.email_filter import (
+    BloomFilter,
+    KnownEmailFilter,
+    current_version,
+    known_emails,
+)
+
+User = get_user_model()
+
+
+class BloomFilterTests(APITestCase):
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        bloom = BloomFilter(capacity=1000, error_rate=0.01)
+        for i in range(1000):
+            bloom.add(f"user{i}@example.com")
+
+        self.assertTrue(all(f"user{i}@example.com" in bloom for i in range(1000)))
+        false_positives = sum(f"other{i}@example.com" in bloom for i in range(10000))
+        self.assertLess(false_positives, 300)
+
+
+@override_settings(EMAIL_FILTER={"VERSION_CHECK_SECONDS": 0, "RESYNC_SECONDS": 300})
+class KnownEmailFilterTests(APITestCase):
+    def setUp(self):
+        known_emails.reset()
+        User.objects.create_user(
+            username="known", password="KnownPass1!", email="Known@Example.com")
+
+    @override_settings(EMAIL_FILTER={"VERSION_CHECK_SECONDS": 60, "RESYNC_SECONDS": 300})
+    def test_unknown_email_rejected_without_query(self):
+        known_emails.might_contain("warmup@example.com")
+
+        with CaptureQueriesContext(connection) as queries:
+            r = self.client.post(reverse("forgot-password"), {
+                "email": "nobody@example.com"
+            }, format="json")
+
+        self.assertEqual(r.status_code, 400)
+        self.assertEqual(len(queries), 0)
+
+    def test_new_user_is_known_immediately(self):
+        known_emails.might_contain("warmup@example.com")
+        User.objects.create_user(
+            username="fresh", password="FreshPass1!", email="fresh@example.com")
+
+        self.assertTrue(known_emails.might_contain("FRESH@example.com"))
+        self.assertTrue(known_emails.might_contain("known@example.com"))
+
+    def test_save_in_another_process_is_seen(self):
+        # `other` shares nothing with known_emails but the DB, like a
+        # filter living in another gunicorn worker.
+        other = KnownEmailFilter()
+        self.assertFalse(other.might_contain("elsewhere@example.com"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(
+                username="elsewhere", password="ElsePass1!", email="elsewhere@example.com")
+
+        self.assertTrue(other.might_contain("elsewhere@example.com"))
+
+    def test_queryset_update_needs_invalidate(self):
+        other = KnownEmailFilter()
+        self.assertFalse(other.might_contain("moved@example.com"))
+
+        User.objects.filter(username="known").update(email="moved@example.com")
+        self.assertFalse(other.might_contain("moved@example.com"))
+
+        known_emails.invalidate()
+        self.assertTrue(other.might_contain("moved@example.com"))
+        r = self.client.post(reverse("forgot-password"), {
+            "email": "moved@example.com"
+        }, format="json")
+        self.assertEqual(r.status_code, 201)
+
+    def test_delete_drops_email_on_next_check(self):
+        self.assertTrue(known_emails.might_contain("known@example.com"))
+        other = KnownEmailFilter()
+        self.assertTrue(other.might_contain("known@example.com"))
+
+        User.objects.filter(username="known").get().delete()
+
+        self.assertFalse(known_emails.might_contain("known@example.com"))
+        self.assertFalse(other.might_contain("known@example.com"))
+
+    def test_recreated_email_reaches_other_workers(self):
+        # known_emails is worker A, `other` is worker B.
+        other = KnownEmailFilter()
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username="x", password="XPass123!", email="x@example.com")
+        self.assertTrue(known_emails.might_contain("x@example.com"))
+        self.assertTrue(other.might_contain("x@example.com"))
+
+        User.objects.get(username="x").delete()
+        self.assertFalse(other.might_contain("x@example.com"))
+
+        # A still has x@example.com in its bloom and hasn't rechecked yet.
+        with self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username="x2", password="XPass123!", email="x@example.com")
+        self.assertTrue(other.might_contain("x@example.com"))
+
+    def test_local_false_positive_still_bumps(self):
+        known_emails.might_contain("warmup@example.com")
+        other = KnownEmailFilter()
+        self.assertFalse(other.might_contain("fp@example.com"))
+
+        with mock.patch("login.email_filter.BloomFilter.__contains__", return_value=True), \
+                self.captureOnCommitCallbacks(execute=True):
+            User.objects.create_user(username="fp", password="FpPass123!", email="fp@example.com")
+
+        self.assertTrue(other.might_contain("fp@example.com"))
+
+    def test_rolled_back_save_does_not_bump(self):
+        known_emails.might_contain("warmup@example.com")
+        version = known_emails._version
+        try:
+            with transaction.atomic():
+                User.objects.create_user(
+                    username="gone", password="GonePass1!", email="gone@example.com")
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(current_version(), version)
+        self.assertEqual(known_emails._version, version)
+
+    def test_unrelated_update_fields_do_not_bump(self):
+        user = User.objects.get(username="known")
+        with self.captureOnCommitCallbacks() as callbacks:
+            user.save(update_fields=["last_login"])
+        self.assertEqual(callbacks, [])
+
+    def test_single_rebuild_while_stale(self):
+        known_emails.might_contain("warmup@example.com")
+        rebuilding = threading.Event()
+        finish = threading.Event()
+        calls = []
+
+        def slow_rebuild():
+            calls.append(1)
+            rebuilding.set()
+            finish.wait(5)
+            return known_emails._filter
+
+        with mock.patch.object(known_emails, "_is_stale", return_value=True), \
+                mock.patch.object(known_emails, "rebuild", side_effect=slow_rebuild):
+            rebuilder = threading.Thread(target=known_emails.might_contain, args=("a@example.com",))
+            rebuilder.start()
+            rebuilding.wait(5)
+
+            # Other threads answer from the old filter without touching the DB.
+            with CaptureQueriesContext(connection) as queries:
+                for _ in range(20):
+                    self.assertTrue(known_emails.might_contain("known@example.com"))
+            self.assertEqual(len(queries), 0)
+
+            finish.set()
+            rebuilder.join()
+
+        self.assertEqual(len(calls), 1)
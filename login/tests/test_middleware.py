@@ -0,0 +1,57 @@
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+from rest_framework.test import APIClient
+
+from HRM.middleware import PathScopedMiddleware
+
+User = get_user_model()
+
+
+class PathScopedMiddlewareTests(TestCase):
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.seen = {}
+
+        def view(request):
+            self.seen["session"] = hasattr(request, "session")
+            self.seen["user"] = hasattr(request, "user")
+            return HttpResponse("ok")
+
+        self.middleware = PathScopedMiddleware(view)
+
+    def test_api_skips_full_stack(self):
+        response = self.middleware(self.factory.post("/api/login/"))
+        self.assertEqual(response.status_code, 200)
+        self.assertFalse(self.seen["session"])
+        self.assertFalse(self.seen["user"])
+
+    def test_admin_and_docs_keep_full_stack(self):
+        for path in ("/admin/", "/api/schema/swagger-ui/"):
+            self.seen.clear()
+            self.middleware(self.factory.get(path))
+            self.assertTrue(self.seen["session"], path)
+            self.assertTrue(self.seen["user"], path)
+
+    def test_browsable_api_keeps_x_frame_options(self):
+        r = self.client.get(reverse("token_obtain_pair"), HTTP_ACCEPT="text/html")
+        self.assertEqual(r["X-Frame-Options"], "DENY")
+
+    def test_api_login_and_refresh_still_work(self):
+        User.objects.create_user(
+            username="lean", password="LeanPass1!", role="employee")
+        client = APIClient(enforce_csrf_checks=True)
+
+        r = client.post(reverse("token_obtain_pair"), {
+            "username": "lean",
+            "password": "LeanPass1!",
+        }, format="json")
+        self.assertEqual(r.status_code, 200)
+        self.assertNotIn("sessionid", r.cookies)
+
+        r2 = client.post(reverse("token_refresh"), {
+            "refresh": r.data["refresh"],
+        }, format="json")
+        self.assertEqual(r2.status_code, 200)
+        self.assertIn("access", r2.data)
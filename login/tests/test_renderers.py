@@ -0,0 +1,78 @@
+import datetime
+import io
+import uuid
+from decimal import Decimal
+from unittest import mock
+
+from django.utils import timezone
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ErrorDetail, ParseError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from login import parsers, renderers
+from login.parsers import FastJSONParser
+from login.renderers import FastJSONRenderer
+
+
+class FastJSONRendererTests(APITestCase):
+    payload = {
+        "refresh": "a.b.c",
+        "role": "employee",
+        "when": datetime.datetime(2025, 11, 1, 9, 30, 15, 123456, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2025, 11, 1),
+        "local": timezone.localtime(
+            datetime.datetime(2025, 11, 1, 9, 30, tzinfo=datetime.timezone.utc)),
+        "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "amount": Decimal("10.50"),
+        "label": gettext_lazy("Email not found."),
+        "errors": {"email": [ErrorDetail("Email not found.", code="invalid")]},
+        "text": "line\u2028sep\u2029 ünïcode",
+    }
+
+    def test_matches_drf_renderer(self):
+        self.assertEqual(
+            FastJSONRenderer().render(self.payload),
+            JSONRenderer().render(self.payload),
+        )
+
+    def test_non_finite_floats_match_drf(self):
+        for value in (float("nan"), float("inf"), -float("inf")):
+            data = {"x": [1.5, value], "y": None}
+            with self.assertRaises(ValueError):
+                JSONRenderer().render(data)
+            with self.assertRaises(ValueError):
+                FastJSONRenderer().render(data)
+
+        with mock.patch.object(FastJSONRenderer, "strict", False), \
+                mock.patch.object(JSONRenderer, "strict", False):
+            data = {"x": float("nan")}
+            self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_and_none(self):
+        renderer = FastJSONRenderer()
+        self.assertEqual(renderer.render(None), b"")
+        self.assertIn(b"\n", renderer.render({"a": 1}, "application/json; indent=4"))
+
+    def test_stdlib_fallback(self):
+        with mock.patch.object(renderers, "orjson", None):
+            self.assertEqual(
+                FastJSONRenderer().render(self.payload),
+                JSONRenderer().render(self.payload),
+            )
+
+
+class FastJSONParserTests(APITestCase):
+    def test_parse(self):
+        data = FastJSONParser().parse(io.BytesIO('{"email": "ü@example.com"}'.encode()))
+        self.assertEqual(data, {"email": "ü@example.com"})
+
+    def test_parse_error(self):
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"email": '))
+        with self.assertRaises(ParseError):
+            FastJSONParser().parse(io.BytesIO(b'{"n": NaN}'))
+
+    def test_stdlib_fallback(self):
+        with mock.patch.object(parsers, "orjson", None):
+            self.assertEqual(FastJSONParser().parse(io.BytesIO(b'{"a": [1, 2]}')), {"a": [1, 2]})
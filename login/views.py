@@ -6,13 +6,15 @@ from .serializers import (
     VerifyOTPSerializer,
     ResetPasswordSerializer,
 )
+from .admission import AdmissionControlMixin
 from rest_framework import status
 from rest_framework.generics import CreateAPIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
 
 
-class CustomLoginView(TokenObtainPairView):
+class CustomLoginView(AdmissionControlMixin, TokenObtainPairView):
+    admission_scope = "login"
     serializer_class = CustomTokenSerializer
 
 
@@ -26,6 +28,7 @@ class VerifyOTPView(CreateAPIView):
     serializer_class = VerifyOTPSerializer
 
 
-class ResetPasswordView(CreateAPIView):
+class ResetPasswordView(AdmissionControlMixin, CreateAPIView):
+    admission_scope = "reset-password"
     permission_classes = [AllowAny]
     serializer_class = ResetPasswordSerializer